@@ -1,41 +1,58 @@
 #!/usr/bin/env python3
 
 import subprocess
-import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
+# 'aba peer -r' only takes one NodeID, so removals run in a small pool instead
+REMOVE_WORKERS = 4
+
 def get_peer_connections() -> List[Tuple[str, str, int]]:
     """Get list of peer connections with their NodeID and ports."""
     try:
-        # Run the peer list command
-        result = subprocess.run(['aba', 'peer', '-c', 'full_node'], 
-                              capture_output=True, text=True, check=True)
-        
         connections = []
-        lines = result.stdout.split('\n')
         
-        # Skip header lines
-        for line in lines[2:]:  # Skip "Connections:" and header line
-            # Match FULL_NODE entries with NodeID and port info
-            match = re.match(r'FULL_NODE\s+(\d+\.\d+\.\d+\.\d+)\s+(\d+)/\d+\s+([a-f0-9]{8}).*', line)
-            if match:
-                ip, port, node_id = match.groups()
-                connections.append((node_id, ip, int(port)))
+        # Run the peer list command, parsing its output as it streams in
+        with subprocess.Popen(['aba', 'peer', '-c', 'full_node'],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True) as proc:
+            # Skip "Connections:" and header line
+            for _ in range(2):
+                next(proc.stdout, None)
+            
+            for line in proc.stdout:
+                # FULL_NODE rows are whitespace-delimited: type, ip, port/peer_port, NodeID...
+                parts = line.split()
+                if len(parts) >= 4 and parts[0] == 'FULL_NODE' and '/' in parts[2]:
+                    ip = parts[1]
+                    octets = ip.split('.')
+                    port = parts[2].split('/', 1)[0]
+                    node_id = parts[3][:8]  # NodeID is printed truncated, e.g. "abcdef12..."
+                    if (len(octets) == 4 and all(o.isascii() and o.isdigit() for o in octets)
+                            and port.isascii() and port.isdigit()
+                            and len(node_id) == 8
+                            and all(c in '0123456789abcdef' for c in node_id)):
+                        connections.append((node_id, ip, int(port)))
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
                 
         return connections
     except subprocess.CalledProcessError as e:
         print(f"Error running 'aba peer' command: {e}")
         return []
 
-def remove_connection(node_id: str) -> bool:
-    """Remove a connection by its NodeID."""
+def remove_connection(node_id: str) -> Tuple[bool, str]:
+    """Remove a connection by its NodeID, returning success and the command's output."""
     try:
-        subprocess.run(['aba', 'peer', '-r', node_id, "full_node"], check=True)
-        return True
+        # Capture output so concurrent removals don't interleave on the terminal
+        result = subprocess.run(['aba', 'peer', '-r', node_id, "full_node"],
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, check=True)
+        return True, result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"Error removing peer {node_id}: {e}")
-        return False
+        return False, f"{e.stdout or ''}Error removing peer {node_id}: {e}\n"
 
 def main():
     # Set up argument parser
@@ -53,17 +70,20 @@ def main():
     connections = get_peer_connections()
     
     # Filter and remove 8444 connections
-    found_count = 0
+    targets = [c for c in connections if c[2] == 8444]
+    found_count = len(targets)
     removed_count = 0
     
-    for node_id, ip, port in connections:
-        if port == 8444:
-            found_count += 1
-            if args.dry_run:
-                print(f"Would remove: {ip}:{port} (NodeID: {node_id})")
-            else:
+    if args.dry_run:
+        for node_id, ip, port in targets:
+            print(f"Would remove: {ip}:{port} (NodeID: {node_id})")
+    elif targets:
+        with ThreadPoolExecutor(max_workers=REMOVE_WORKERS) as executor:
+            results = executor.map(remove_connection, [node_id for node_id, _, _ in targets])
+            for (node_id, ip, port), (removed, output) in zip(targets, results):
                 print(f"Found port 8444 connection: {ip}:{port} (NodeID: {node_id})")
-                if remove_connection(node_id):
+                print(output, end='')
+                if removed:
                     print(f"Successfully removed connection to {ip}")
                     removed_count += 1
                 else: